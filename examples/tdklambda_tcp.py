@@ -20,7 +20,6 @@ if __name__ == "__main__":
     atexit.register(dev.quit)
     dev.identify()
     while True:
-        dev.query_voltage()
-        dev.query_current()
-        dev.query_output()
+        # One compound round-trip instead of three separate queries
+        volts, amps, output = dev.query_many(["SOUR:VOLT?", "SOUR:CURR?", "OUTP:STAT?"])
         time.sleep(1)
@@ -0,0 +1,24 @@
+"""Helpers for orchestrating many devices concurrently
+
+Plain 'for dev in devices: await dev.measure_voltage()' loops serialize on each device's
+round-trip; these helpers overlap them. Devices sharing one physical link (same transport
+instance) serialize on the protocol/transport locks anyway, so use limit=1 per shared bus or
+just let the locks do their job; independent transports can fan out freely"""
+
+from typing import Any, Awaitable, List, Optional
+import asyncio
+
+
+async def gather_bounded(limit: Optional[int], *aws: Awaitable[Any]) -> List[Any]:
+    """Like asyncio.gather but with at most limit awaitables in flight at a time,
+    pass limit=None for plain unbounded gather"""
+    if limit is None:
+        return list(await asyncio.gather(*aws))
+    semaphore = asyncio.Semaphore(limit)
+
+    async def _bounded(awaitable: Awaitable[Any]) -> Any:
+        """Wrap the awaitable in the semaphore"""
+        async with semaphore:
+            return await awaitable
+
+    return list(await asyncio.gather(*(_bounded(awaitable) for awaitable in aws)))
@@ -1,8 +1,9 @@
 """TDK Lambda power supplies"""
 
 # pylint: disable=C0103
-from typing import Optional, Union, Any
+from typing import Dict, Optional, Sequence, Tuple, Union, Any
 from dataclasses import dataclass, field
+import asyncio
 import decimal
 import logging
 
@@ -11,10 +12,38 @@ import serial as pyserial  # type: ignore
 from ..scpi import SCPIDevice, SCPIProtocol
 from ..transports.rs232 import RS232Transport
 from ..transports.tcp import get as get_tcp
-from .generic import PowerSupply
+from .generic import NumberCombo, PowerSupply, parse_number
 
 StrIntCombo = Union[str, int]
+VALID_STATES = frozenset((1, 2, 3, 4))
 LOGGER = logging.getLogger(__name__)
+ON_OFF_MAP: Dict[StrIntCombo, str] = {
+    "1": "1",
+    "ON": "1",
+    "on": "1",
+    "TRUE": "1",
+    "true": "1",
+    1: "1",
+    "0": "0",
+    "OFF": "0",
+    "off": "0",
+    "FALSE": "0",
+    "false": "0",
+    0: "0",
+}
+
+
+def normalize_on_off(setting: StrIntCombo) -> str:
+    """Normalize ON/OFF/TRUE/FALSE/1/0 (case-insensitive) to the "1"/"0" form the device expects"""
+    # Common spellings hit directly without paying for str()/upper() allocations
+    try:
+        return ON_OFF_MAP[setting]
+    except (KeyError, TypeError):
+        pass
+    try:
+        return ON_OFF_MAP[str(setting).upper()]
+    except KeyError as exc:
+        raise ValueError(f"Cannot interpret {setting!r} as boolean setting") from exc
 
 
 class TDKSCPI(SCPIDevice):
@@ -27,22 +56,15 @@ class TDKSCPI(SCPIDevice):
         * OFF/0/false - This choice disable the clearing of the listed registers and they retain
                         their status when a power-on condition occurs
         """
-        setting = str(setting).upper()
-        if setting in ("1", "ON", "TRUE"):
-            setting = "1"
-        elif setting in ("0", "OFF", "FALSE"):
-            setting = "0"
-        else:
-            raise ValueError
-        await super().set_power_on_status_clear(setting)
+        await super().set_power_on_status_clear(normalize_on_off(setting))
 
     async def restore_state(self, state: int) -> None:
         """
         Restores the power supply to a state previously stored in memory by *SAV command.
         """
         state = int(state)
-        if state not in (1, 2, 3, 4):
-            raise ValueError("invalid state")
+        if state not in VALID_STATES:
+            raise ValueError(f"state {state} invalid")
 
         await super().restore_state(state)
 
@@ -51,8 +73,8 @@ class TDKSCPI(SCPIDevice):
         The SAV command saves all applied configuration settings.
         """
         state = int(state)
-        if state not in (1, 2, 3, 4):
-            raise ValueError("Invalid state")
+        if state not in VALID_STATES:
+            raise ValueError(f"state {state} invalid")
 
         await super().save_state(state)
 
@@ -65,14 +87,7 @@ class TDKSCPI(SCPIDevice):
         * 0 - SAFE - The power supply output will remain Off after the fault
                      condition is removed or after AC recycle.
         """
-        setting = str(setting).upper()
-        if setting in ("1", "ON", "TRUE"):
-            setting = "1"
-        elif setting in ("0", "OFF", "FALSE"):
-            setting = "0"
-        else:
-            raise ValueError
-        await super().power_on_state(setting)
+        await super().power_on_state(normalize_on_off(setting))
 
 
 @dataclass
@@ -82,38 +97,60 @@ class TDKLambdaZplus(PowerSupply, TDKSCPI):
     voltage_limit: float = field(default=20.0)
     current_limit: float = field(default=10.0)
 
-    async def measure_current(self, extra_params: str = "") -> decimal.Decimal:
+    async def measure_current(self, extra_params: str = "", *, exact: bool = True) -> NumberCombo:
         """
         Returns the actual output current in amps.
 
         extra_params: String to append to the command.  The only valid command
                 for this device is ":DC"
+        exact: Pass False to parse the reply as float instead of Decimal (cheaper on hot paths)
         """
 
         resp = await self.ask(f"MEAS:CURR{extra_params}?")
-        return decimal.Decimal(resp)
+        return parse_number(resp, exact)
 
-    async def measure_voltage(self, extra_params: str = "") -> decimal.Decimal:
+    async def measure_voltage(self, extra_params: str = "", *, exact: bool = True) -> NumberCombo:
         """
         Returns the actual output voltage in volts.
 
         extra_params: String to append to the command.  The only valid command
                 for this device is ":DC"
+        exact: Pass False to parse the reply as float instead of Decimal (cheaper on hot paths)
         """
 
         resp = await self.ask(f"MEAS:VOLT{extra_params}?")
-        return decimal.Decimal(resp)
-
-    async def measure_power(self, extra_params: str = "") -> decimal.Decimal:
+        return parse_number(resp, exact)
+
+    async def measure_voltage_current(
+        self, extra_params: str = "", *, exact: bool = True
+    ) -> Tuple[NumberCombo, NumberCombo]:
+        """Returns the measured voltage (in volts) and current (in amps) in a single
+        compound round-trip, this device uses MEAS:VOLT/MEAS:CURR instead of the SCAL forms"""
+        resp = await self.query_many([f"MEAS:VOLT{extra_params}?", f"MEAS:CURR{extra_params}?"])
+        return (parse_number(resp[0], exact), parse_number(resp[1], exact))
+
+    async def measure_voltage_current_power(
+        self, extra_params: str = "", *, exact: bool = True
+    ) -> Tuple[NumberCombo, NumberCombo, NumberCombo]:
+        """Returns the measured voltage (in volts), current (in amps) and power (in watts) in a
+        single compound round-trip instead of three, pass extra_params string to append to each
+        of the commands (like ":DC")"""
+        resp = await self.query_many(
+            [f"MEAS:VOLT{extra_params}?", f"MEAS:CURR{extra_params}?", f"MEAS:POW{extra_params}?"]
+        )
+        return (parse_number(resp[0], exact), parse_number(resp[1], exact), parse_number(resp[2], exact))
+
+    async def measure_power(self, extra_params: str = "", *, exact: bool = True) -> NumberCombo:
         """
         Returns the actual output power in watts.
 
         extra_params: String to append to the command.  The only valid command
                 for this device is ":DC"
+        exact: Pass False to parse the reply as float instead of Decimal (cheaper on hot paths)
         """
 
         resp = await self.ask(f"MEAS:POW{extra_params}?")
-        return decimal.Decimal(resp)
+        return parse_number(resp, exact)
 
     async def select_active_instrument(self, select_id: int) -> None:
         """
@@ -125,10 +162,32 @@ class TDKLambdaZplus(PowerSupply, TDKSCPI):
         _id = int(select_id)
 
         if _id < 1 or _id > 31:
-            raise ValueError("id %d is outside of the valid id range" % _id)
+            raise ValueError(f"id {_id:d} is outside of the valid id range")
 
         await self.command(f"INSTrument:NSELect {_id:d}")
 
+    async def measure_all(
+        self, select_ids: Sequence[int], *, exact: bool = True
+    ) -> Dict[int, Tuple[NumberCombo, NumberCombo, NumberCombo]]:
+        """Measure voltage (volts), current (amps) and power (watts) for each of the listed
+        daisy-chained supplies (see select_active_instrument), pipelining the instrument select
+        and the three queries into one compound round-trip per supply.
+
+        Supplies on separate transports can be sampled concurrently by wrapping the per-device
+        calls in asyncio.gather"""
+        ret: Dict[int, Tuple[NumberCombo, NumberCombo, NumberCombo]] = {}
+        for select_id in select_ids:
+            _id = int(select_id)
+            if _id < 1 or _id > 31:
+                raise ValueError(f"id {_id:d} is outside of the valid id range")
+            resp = await self.query_many([f"INSTrument:NSELect {_id:d}", "MEAS:VOLT?", "MEAS:CURR?", "MEAS:POW?"])
+            ret[_id] = (
+                parse_number(resp[-3], exact),
+                parse_number(resp[-2], exact),
+                parse_number(resp[-1], exact),
+            )
+        return ret
+
     async def query_active_instrument(self) -> int:
         """
         Returns the ID of the active instrument.
@@ -145,9 +204,9 @@ class TDKLambdaZplus(PowerSupply, TDKSCPI):
         couple = couple.upper()
 
         if couple in ("NONE", "ALL"):
-            await self.command("INSTrument:COUPle %s" % couple)
+            await self.command(f"INSTrument:COUPle {couple}")
         else:
-            raise ValueError("Argument '%s' not valid for INST:COUP" % couple)
+            raise ValueError(f"Argument '{couple}' not valid for INST:COUP")
 
     async def set_voltage_protection(self, volts: Any) -> None:
         """
@@ -181,28 +240,14 @@ class TDKLambdaZplus(PowerSupply, TDKSCPI):
         Make the front panel voltage and Current displays flash.
         """
 
-        setting = str(setting).upper()
-        if setting in ("1", "ON", "TRUE"):
-            setting = "1"
-        elif setting in ("0", "OFF", "FALSE"):
-            setting = "0"
-        else:
-            raise ValueError
-        await self.command(f"DISPlay:FLASh {setting}")
+        await self.command(f"DISPlay:FLASh {normalize_on_off(setting)}")
 
     async def global_enable(self, setting: StrIntCombo) -> None:
         """
         Set enable status of all units.
         """
 
-        setting = str(setting).upper()
-        if setting in ("1", "ON", "TRUE"):
-            setting = "1"
-        elif setting in ("0", "OFF", "FALSE"):
-            setting = "0"
-        else:
-            raise ValueError
-        await self.command(f"GLOBal:OUTPut:STATe {setting}")
+        await self.command(f"GLOBal:OUTPut:STATe {normalize_on_off(setting)}")
 
     async def global_set_voltage(self, volts: float) -> None:
         """
@@ -246,6 +291,22 @@ class TDKLambdaZplus(PowerSupply, TDKSCPI):
 
         await super().set_current(milliamps, extra_params=extra_params)
 
+    async def program(
+        self,
+        *,
+        millivolts: Optional[float] = None,
+        milliamps: Optional[float] = None,
+        output: Optional[bool] = None,
+        extra_params: str = "",
+    ) -> None:
+        """See baseclass, validates against the voltage/current limits of the unit before
+        assembling the compound message"""
+        if millivolts is not None and (millivolts / 1000.0 > 1.05 * self.voltage_limit or millivolts < 0):
+            raise ValueError
+        if milliamps is not None and (milliamps / 1000.0 > 1.05 * self.current_limit or milliamps < 0):
+            raise ValueError
+        await super().program(millivolts=millivolts, milliamps=milliamps, output=output, extra_params=extra_params)
+
 
 def tcp(ipaddr: str, port: int) -> TDKLambdaZplus:
     """Quick helper to connect via TCP"""
@@ -256,9 +317,9 @@ def tcp(ipaddr: str, port: int) -> TDKLambdaZplus:
     return dev
 
 
-def serial(serial_url: str, baudrate: int = 9600) -> TDKLambdaZplus:
-    """Quick helper to connect via serial"""
-    port = pyserial.serial_for_url(
+def _open_serial_port(serial_url: str, baudrate: int) -> pyserial.SerialBase:
+    """Blocking pyserial open, split out so serial_async can push it to an executor"""
+    return pyserial.serial_for_url(
         serial_url,
         baudrate=baudrate,
         bytesize=8,
@@ -269,6 +330,22 @@ def serial(serial_url: str, baudrate: int = 9600) -> TDKLambdaZplus:
         dsrdtr=False,
         timeout=10,
     )
+
+
+def serial(serial_url: str, baudrate: int = 9600) -> TDKLambdaZplus:
+    """Quick helper to connect via serial"""
+    port = _open_serial_port(serial_url, baudrate)
+    transport = RS232Transport(serialdevice=port)
+    protocol = SCPIProtocol(transport)
+    dev = TDKLambdaZplus(protocol)
+    return dev
+
+
+async def serial_async(serial_url: str, baudrate: int = 9600) -> TDKLambdaZplus:
+    """Like serial() but safe to call with the event loop running: the port open (which can
+    block for seconds on enumeration and DTR negotiation) runs in an executor instead of
+    stalling every other coroutine"""
+    port = await asyncio.get_event_loop().run_in_executor(None, _open_serial_port, serial_url, baudrate)
     transport = RS232Transport(serialdevice=port)
     protocol = SCPIProtocol(transport)
     dev = TDKLambdaZplus(protocol)
@@ -1,29 +1,50 @@
 """Mixins for different device functionalities"""
 
+from typing import List, Optional, Tuple, Union
 import decimal
 
 from ..scpi import SCPIDevice
 
+NumberCombo = Union[float, decimal.Decimal]
+
+
+def parse_number(response: str, exact: bool = True) -> NumberCombo:
+    """Parse a numeric response, Decimal by default like the rest of the module; pass exact=False
+    to get a much cheaper float for telemetry-style polling where exactness does not matter"""
+    if exact:
+        return decimal.Decimal(response)
+    return float(response)
+
 
 class MultiMeter(SCPIDevice):
     """Multimeter related features"""
 
-    async def measure_voltage(self, extra_params: str = "") -> decimal.Decimal:
+    async def measure_voltage(self, extra_params: str = "", *, exact: bool = True) -> NumberCombo:
         """Returns the measured (scalar) actual output voltage (in volts),
-        pass extra_params string to append to the command (like ":ACDC")"""
+        pass extra_params string to append to the command (like ":ACDC"),
+        pass exact=False to parse the reply as float instead of Decimal (cheaper on hot paths)"""
         resp = await self.ask(f"MEAS:SCAL:VOLT{extra_params}?")
-        return decimal.Decimal(resp)
+        return parse_number(resp, exact)
 
-    async def measure_current(self, extra_params: str = "") -> decimal.Decimal:
+    async def measure_current(self, extra_params: str = "", *, exact: bool = True) -> NumberCombo:
         """Returns the measured (scalar) actual output current (in amps),
-        pass extra_params string to append to the command (like ":ACDC")"""
+        pass extra_params string to append to the command (like ":ACDC"),
+        pass exact=False to parse the reply as float instead of Decimal (cheaper on hot paths)"""
         resp = await self.ask(f"MEAS:SCAL:CURR{extra_params}?")
-        return decimal.Decimal(resp)
+        return parse_number(resp, exact)
+
+    async def measure_voltage_current(
+        self, extra_params: str = "", *, exact: bool = True
+    ) -> Tuple[NumberCombo, NumberCombo]:
+        """Returns the measured voltage (in volts) and current (in amps) in a single
+        compound round-trip, pass extra_params string to append to both commands (like ":ACDC")"""
+        resp = await self.query_many([f"MEAS:SCAL:VOLT{extra_params}?", f"MEAS:SCAL:CURR{extra_params}?"])
+        return (parse_number(resp[0], exact), parse_number(resp[1], exact))
 
     async def set_measure_current_max(self, amps: float) -> None:
         """Sets the upper bound (in amps) of current to measure,
         on some devices low-current accuracy can be increased by keeping this low"""
-        await self.command(f"SENS:CURR:RANG {amps:f}")
+        await self.command(f"SENS:CURR:RANG {amps:.12g}")
 
     async def query_measure_current_max(self) -> decimal.Decimal:
         """Returns the upper bound (in amps) of current to measure,
@@ -38,7 +59,7 @@ class PowerSupply(SCPIDevice):
     async def set_voltage(self, millivolts: float, extra_params: str = "") -> None:
         """Sets the desired output voltage (but does not auto-enable outputs) in millivolts,
         pass extra_params string to append to the command (like ":PROT")"""
-        await self.command(f"SOUR:VOLT{extra_params} {millivolts:f} MV")
+        await self.command(f"SOUR:VOLT{extra_params} {millivolts:.12g} MV")
 
     async def query_voltage(self, extra_params: str = "") -> decimal.Decimal:
         """Returns the set output voltage (in volts),
@@ -49,7 +70,7 @@ class PowerSupply(SCPIDevice):
     async def set_current(self, milliamps: float, extra_params: str = "") -> None:
         """Sets the desired output current (but does not auto-enable outputs) in milliamps,
         pass extra_params string to append to the command (like ":TRIG")"""
-        await self.command(f"SOUR:CURR{extra_params} {milliamps:f} MA")
+        await self.command(f"SOUR:CURR{extra_params} {milliamps:.12g} MA")
 
     async def query_current(self, extra_params: str = "") -> decimal.Decimal:
         """Returns the set output current (in amps),
@@ -57,6 +78,39 @@ class PowerSupply(SCPIDevice):
         resp = await self.ask(f"SOUR:CURR{extra_params}?")
         return decimal.Decimal(resp)
 
+    async def set_and_query_voltage(self, millivolts: float, extra_params: str = "") -> decimal.Decimal:
+        """Sets the desired output voltage and reads the set value back (in volts) in a single
+        compound round-trip, pass extra_params string to append to both commands (like ":PROT")"""
+        resp = await self.query_many([f"SOUR:VOLT{extra_params} {millivolts:.12g} MV", f"SOUR:VOLT{extra_params}?"])
+        return decimal.Decimal(resp[-1])
+
+    async def set_and_query_current(self, milliamps: float, extra_params: str = "") -> decimal.Decimal:
+        """Sets the desired output current and reads the set value back (in amps) in a single
+        compound round-trip, pass extra_params string to append to both commands (like ":TRIG")"""
+        resp = await self.query_many([f"SOUR:CURR{extra_params} {milliamps:.12g} MA", f"SOUR:CURR{extra_params}?"])
+        return decimal.Decimal(resp[-1])
+
+    async def program(
+        self,
+        *,
+        millivolts: Optional[float] = None,
+        milliamps: Optional[float] = None,
+        output: Optional[bool] = None,
+        extra_params: str = "",
+    ) -> None:
+        """Program voltage (in millivolts), current (in milliamps) and/or output state in one
+        compound round-trip instead of one per setting, pass None to leave a setting untouched,
+        pass extra_params string to append to the voltage/current commands (like ":TRIG")"""
+        commands: List[str] = []
+        if millivolts is not None:
+            commands.append(f"SOUR:VOLT{extra_params} {millivolts:.12g} MV")
+        if milliamps is not None:
+            commands.append(f"SOUR:CURR{extra_params} {milliamps:.12g} MA")
+        if output is not None:
+            commands.append(f"OUTP:STAT {output:d}")
+        if commands:
+            await self.command_many(commands)
+
     async def set_output(self, state: bool) -> None:
         """Enables/disables output"""
         await self.command(f"OUTP:STAT {state:d}")
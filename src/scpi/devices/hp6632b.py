@@ -1,13 +1,15 @@
 """HP/Agilent 3362B specific device implementation and helpers"""
 
-from typing import Any
+from typing import Any, Optional
+import asyncio
+import functools
 import logging
 import decimal
 
 from ..scpi import SCPIDevice, SCPIProtocol
 from ..transports.rs232 import RS232Transport
 from ..transports.rs232 import get as get_rs232
-from .generic import MultiMeter, PowerSupply
+from .generic import MultiMeter, NumberCombo, PowerSupply
 
 LOGGER = logging.getLogger(__name__)
 
@@ -15,6 +17,14 @@ LOGGER = logging.getLogger(__name__)
 class HP6632B(PowerSupply, MultiMeter, SCPIDevice):
     """Adds the HP/Agilent 3362B specific SCPI commands as methods"""
 
+    _cached_low_current_mode: Optional[bool] = None
+    _transport_is_rs232: Optional[bool] = None
+
+    async def reset(self) -> None:
+        """See baseclass, also invalidates the cached measurement range"""
+        self._cached_low_current_mode = None
+        return await super().reset()
+
     async def set_low_current_mode(self, state: bool) -> None:
         """The low-current mode is enabled by setting the range to (max) 20mA, anything over that is high-current mode.
         This model has max 5A output"""
@@ -22,18 +32,35 @@ class HP6632B(PowerSupply, MultiMeter, SCPIDevice):
             return await self.set_measure_current_max(0.020)
         return await self.set_measure_current_max(5.0)
 
+    async def set_measure_current_max(self, amps: float) -> None:
+        """See baseclass, also keeps the cached range state up to date"""
+        await super().set_measure_current_max(amps)
+        self._cached_low_current_mode = amps <= 0.020
+
     async def query_low_current_mode(self) -> bool:
-        """Returns boolean indicating whether we are in low or high current mode"""
+        """Returns boolean indicating whether we are in low or high current mode
+
+        Served from a local cache when we know the range to save a round-trip, the cache is
+        kept up to date by set_measure_current_max and invalidated by reset"""
+        if self._cached_low_current_mode is not None:
+            return self._cached_low_current_mode
         max_current = await self.query_measure_current_max()
-        if max_current <= 0.020:
-            return True
-        return False
+        self._cached_low_current_mode = max_current <= 0.020
+        return self._cached_low_current_mode
 
-    async def measure_current_autorange(self, extra_params: str = "") -> decimal.Decimal:
+    async def measure_current_autorange(self, extra_params: str = "") -> NumberCombo:
         """Measures the current, then make sure we are running on the correct measurement range
-        and if not switch range and measure again"""
-        ret = await self.measure_current(extra_params)
-        if abs(ret) < 0.020:
+        and if not switch range and measure again
+
+        When the range cache is cold the measurement and the range query are pipelined into
+        one compound round-trip instead of being asked separately"""
+        if self._cached_low_current_mode is None:
+            resp = await self.query_many([f"MEAS:SCAL:CURR{extra_params}?", "SENS:CURR:RANG?"])
+            ret: NumberCombo = decimal.Decimal(resp[-2])
+            self._cached_low_current_mode = decimal.Decimal(resp[-1]) <= decimal.Decimal("0.020")
+        else:
+            ret = await self.measure_current(extra_params)
+        if -0.020 < ret < 0.020:
             # We need to be in low-current mode
             if not await self.query_low_current_mode():
                 # Enter low current mode and measure again
@@ -48,8 +75,13 @@ class HP6632B(PowerSupply, MultiMeter, SCPIDevice):
         return ret
 
     def ensure_transport_is_rs232(self) -> None:
-        """Ensures transport is RS232, raises error if not"""
-        if not isinstance(self.protocol.transport, RS232Transport):
+        """Ensures transport is RS232, raises error if not
+
+        Transport identity cannot change after construction so the isinstance result is
+        resolved once and cached, this gets called before every remote/rwlock command"""
+        if self._transport_is_rs232 is None:
+            self._transport_is_rs232 = isinstance(self.protocol.transport, RS232Transport)
+        if not self._transport_is_rs232:
             raise RuntimeError("Only usable with RS232 transports")
 
     async def set_remote_mode(self, state: bool = True) -> None:
@@ -78,7 +110,7 @@ class HP6632B(PowerSupply, MultiMeter, SCPIDevice):
         """Set the display mode, valied values are NORM and TEXT"""
         mode = mode.upper()
         if mode not in ("NORM", "TEXT"):
-            raise ValueError("Invalid mode %s, valid ones are NORM and TEXT" % mode)
+            raise ValueError(f"Invalid mode {mode}, valid ones are NORM and TEXT")
         return await self.command(f"DISP:MODE {mode}")
 
     async def set_display_text(self, text: str) -> None:
@@ -99,3 +131,12 @@ def rs232(serial_url: str, **kwargs: Any) -> HP6632B:
     protocol = SCPIProtocol(transport)
     dev = HP6632B(protocol)
     return dev
+
+
+async def rs232_async(serial_url: str, **kwargs: Any) -> HP6632B:
+    """Like rs232() but safe to call with the event loop running: the blocking port open
+    runs in an executor instead of stalling every other coroutine"""
+    transport = await asyncio.get_event_loop().run_in_executor(None, functools.partial(get_rs232, serial_url, **kwargs))
+    protocol = SCPIProtocol(transport)
+    dev = HP6632B(protocol)
+    return dev
@@ -1,9 +1,9 @@
 """Generic SCPI commands, allow sending and reading of raw data, helpers to parse information"""
 
-from typing import Any, Tuple, Sequence, Union, Optional, cast
+from typing import Any, Dict, Tuple, Sequence, Union, Optional, cast
 import asyncio
-import re
 import logging
+import time
 from dataclasses import dataclass, field
 
 from .errors import CommandError
@@ -12,7 +12,7 @@ from .transports.gpib import GPIBDeviceTransport, GPIBTransport
 
 
 COMMAND_DEFAULT_TIMEOUT = 1.0
-ERROR_RE = re.compile(r'([+-]?\d+),"(.*?)"')
+FAST_ERROR_CHECK_TIMEOUT = 0.2
 LOGGER = logging.getLogger(__name__)
 
 
@@ -143,9 +143,17 @@ class SCPIProtocol:
     """Implements the SCPI protocol talks over the given transport"""
 
     transport: Union[BaseTransport, GPIBDeviceTransport, GPIBTransport] = field()
-    lock: asyncio.Lock = field(default_factory=asyncio.Lock)
+    lock: Optional[asyncio.Lock] = field(default=None)
     _checking_error: bool = field(default=False)
 
+    def _get_lock(self) -> asyncio.Lock:
+        """Create the lock lazily so it binds to the running event loop, pre-3.10 asyncio
+        primitives capture their loop at construction time which breaks protocols that are
+        instantiated outside the loop they are later used in"""
+        if self.lock is None:
+            self.lock = asyncio.Lock()
+        return self.lock
+
     async def quit(self) -> None:
         """Shuts down any background threads that might be active"""
         await self.transport.quit()
@@ -154,6 +162,20 @@ class SCPIProtocol:
         """Shortcut to the transports abort_command call"""
         await self.transport.abort_command()
 
+    @staticmethod
+    def parse_error(response: str) -> Tuple[int, str]:
+        """Parse the error code and string from a SYST:ERR? response ('<code>,"<message>"')"""
+        # Fast-path the overwhelmingly common "no error" reply
+        if response.startswith(("+0,", "0,")):
+            return (0, "No error")
+        code_str, _, errstr = response.partition(",")
+        try:
+            code = int(code_str)
+        except ValueError as exc:
+            # PONDER: Make our own exceptions ??
+            raise ValueError("Response '{:s}' does not have correct error format".format(response)) from exc
+        return (code, errstr.strip().strip('"'))
+
     async def get_error(self) -> Tuple[int, str]:
         """Asks for the error code and string"""
         if self._checking_error:
@@ -161,13 +183,7 @@ class SCPIProtocol:
         try:
             self._checking_error = True
             response = await self.ask("SYST:ERR?", auto_check_error=False)
-            match = ERROR_RE.search(response)
-            if not match:
-                # PONDER: Make our own exceptions ??
-                raise ValueError("Response '{:s}' does not have correct error format".format(response))
-            code = int(match.group(1))
-            errstr = match.group(2)
-            return (code, errstr)
+            return self.parse_error(response)
         finally:
             self._checking_error = False
 
@@ -177,6 +193,21 @@ class SCPIProtocol:
         if code != 0:
             raise CommandError(prev_command, code, errstr)
 
+    async def check_error_fast(self, prev_command: str = "", stb_timeout: float = FAST_ERROR_CHECK_TIMEOUT) -> None:
+        """Cheaper error check for paths where the link may be unhealthy: read the status byte
+        with a tight timeout first and only pull the full SYST:ERR? when the error-available
+        bit is set. A link that just timed out gives up after stb_timeout here instead of
+        stacking another full round-trip on top of the original timeout"""
+        try:
+            response = await self.ask("*STB?", cmd_timeout=stb_timeout, abort_on_timeout=False, auto_check_error=False)
+            stb = int(response)
+        except (asyncio.TimeoutError, ValueError):
+            LOGGER.debug("Could not read status byte for fast error check")
+            return
+        if not stb & 4:  # STBBit.eav, the error queue is empty
+            return
+        await self.check_error(prev_command)
+
     async def command(
         self,
         command: str,
@@ -191,14 +222,14 @@ class SCPIProtocol:
             async def _command(command: str) -> None:
                 """Wrap the actual work"""
                 nonlocal self
-                async with self.lock:
+                async with self._get_lock():
                     await self.transport.send_command(command)
 
             await asyncio.wait_for(_command(command), timeout=cmd_timeout)
         except asyncio.TimeoutError as err:
-            # check for the actual error if available
+            # check for the actual error if available (cheaply, the link just timed out)
             if auto_check_error:
-                await self.check_error(command)
+                await self.check_error_fast(command)
             if abort_on_timeout:
                 await self.abort_command()
             # re-raise the timeout if no other error found
@@ -208,7 +239,17 @@ class SCPIProtocol:
         # other errors are allowed to bubble-up as-is
 
     async def safe_command(self, command: str, *args: Any, **kwargs: Any) -> None:
-        """See "command", this just auto-checks for errors each time"""
+        """See "command", this just auto-checks for errors each time
+
+        If the transport supports batching the error query is appended to the command itself
+        so the check does not cost an extra round-trip"""
+        if getattr(self.transport, "batching_supported", False):
+            kwargs["auto_check_error"] = False
+            response = await self.ask(command + ";:SYST:ERR?", *args, **kwargs)
+            code, errstr = self.parse_error(response)
+            if code != 0:
+                raise CommandError(command, code, errstr)
+            return
         await self.command(command, *args, **kwargs)
         await self.check_error(command)
 
@@ -226,15 +267,15 @@ class SCPIProtocol:
             async def _ask(command: str) -> str:
                 """Wrap the actual work"""
                 nonlocal self
-                async with self.lock:
+                async with self._get_lock():
                     await self.transport.send_command(command)
                     return await self.transport.get_response()
 
             return await asyncio.wait_for(_ask(command), timeout=cmd_timeout)
         except asyncio.TimeoutError as err:
-            # check for the actual error if available
+            # check for the actual error if available (cheaply, the link just timed out)
             if auto_check_error:
-                await self.check_error(command)
+                await self.check_error_fast(command)
             if abort_on_timeout:
                 await self.abort_command()
             # re-raise the timeout if no other error found
@@ -246,23 +287,86 @@ class SCPIProtocol:
         # other errors are allowed to bubble-up as-is
 
     async def safe_ask(self, command: str, *args: Any, **kwargs: Any) -> str:
-        """See "ask", this just autp-checks for errors each time"""
+        """See "ask", this just auto-checks for errors each time
+
+        If the transport supports batching the error query is appended to the query itself
+        so the check does not cost an extra round-trip"""
+        if getattr(self.transport, "batching_supported", False):
+            kwargs["auto_check_error"] = False
+            response = await self.ask(command + ";:SYST:ERR?", *args, **kwargs)
+            user_response, _, error_response = response.rpartition(";")
+            code, errstr = self.parse_error(error_response)
+            if code != 0:
+                raise CommandError(command, code, errstr)
+            return user_response
         response = await self.ask(command, *args, **kwargs)
         await self.check_error(command)
         return response
 
+    async def command_many(self, commands: Sequence[str], *args: Any, **kwargs: Any) -> None:
+        """Compound multiple commands into a single ';'-separated write, on transports without
+        batching support the commands are sent sequentially"""
+        if not getattr(self.transport, "batching_supported", False):
+            for command in commands:
+                await self.command(command, *args, **kwargs)
+            return
+        compound = commands[0] + "".join(";:" + command for command in commands[1:])
+        await self.command(compound, *args, **kwargs)
+
+    async def safe_command_many(self, commands: Sequence[str], *args: Any, **kwargs: Any) -> None:
+        """See "command_many", this just auto-checks for errors each time (one check for the
+        whole batch)"""
+        if getattr(self.transport, "batching_supported", False):
+            compound = commands[0] + "".join(";:" + command for command in commands[1:])
+            # safe_command piggybacks the error query on the same write
+            return await self.safe_command(compound, *args, **kwargs)
+        for command in commands:
+            await self.command(command, *args, **kwargs)
+        await self.check_error(";".join(commands))
+
+    async def ask_many(self, commands: Sequence[str], *args: Any, **kwargs: Any) -> Sequence[str]:
+        """Compound multiple queries into a single ';'-separated round-trip, returns the responses
+        in the same order as the commands. Requires a transport with batching support"""
+        if not getattr(self.transport, "batching_supported", False):
+            # Fall back to sequential round-trips
+            return [await self.ask(command, *args, **kwargs) for command in commands]
+        # Prefix subsequent commands with ':' so they resolve from the command tree root
+        compound = commands[0] + "".join(";:" + command for command in commands[1:])
+        response = await self.ask(compound, *args, **kwargs)
+        return response.strip().split(";")
+
+    async def safe_ask_many(self, commands: Sequence[str], *args: Any, **kwargs: Any) -> Sequence[str]:
+        """See "ask_many", this just auto-checks for errors each time (one check covering the
+        whole batch, piggybacked on the same round-trip when the transport supports batching)"""
+        if getattr(self.transport, "batching_supported", False):
+            kwargs["auto_check_error"] = False
+            responses = await self.ask_many(list(commands) + ["SYST:ERR?"], *args, **kwargs)
+            code, errstr = self.parse_error(responses[-1])
+            if code != 0:
+                raise CommandError(";".join(commands), code, errstr)
+            return responses[:-1]
+        responses = await self.ask_many(commands, *args, **kwargs)
+        await self.check_error(";".join(commands))
+        return responses
+
 
 @dataclass
-class SCPIDevice:  # pylint: disable=R0904
+class SCPIDevice:  # pylint: disable=R0904,R0902
     """Implements nicer wrapper methods for the raw commands from the generic SCPI command set
 
     See also devices.mixins for mixin classes with more features"""
 
     instancefrom: Union[BaseTransport, "SCPIDevice", SCPIProtocol, GPIBDeviceTransport, GPIBTransport]
     use_safe_variants: bool = field(default=True)
+    # Check for errors only every N:th query, 1 (the default) checks on every one.
+    # Commands that change device state are always checked.
+    error_check_interval: int = field(default=1)
     protocol: SCPIProtocol = field(init=False)
     transport: AbstractTransport = field(init=False)
     _can_poll: bool = field(default=False)
+    _asks_since_check: int = field(default=0, init=False)
+    _query_cache: Dict[str, Tuple[float, str]] = field(default_factory=dict, init=False)
+    _last_set_values: Dict[str, str] = field(default_factory=dict, init=False)
 
     def __post_init__(self) -> None:
         """Set protocol and transport based on what we're instancing from"""
@@ -293,14 +397,73 @@ class SCPIDevice:  # pylint: disable=R0904
             return await self.protocol.safe_command(command, cmd_timeout, abort_on_timeout)
         return await self.protocol.command(command, cmd_timeout, abort_on_timeout)
 
+    def _error_check_due(self) -> bool:
+        """Rate-limits query error checks, returns True on every error_check_interval:th call"""
+        self._asks_since_check += 1
+        if self._asks_since_check >= self.error_check_interval:
+            self._asks_since_check = 0
+            return True
+        return False
+
     async def ask(
         self, command: str, cmd_timeout: float = COMMAND_DEFAULT_TIMEOUT, abort_on_timeout: bool = True
     ) -> str:
-        """Wrap the protocol ask (using safe version if requested)"""
-        if self.use_safe_variants:
+        """Wrap the protocol ask (using safe version if requested)
+
+        Set error_check_interval > 1 to only pay the error-check round-trip on every N:th query,
+        errors are rare in read-only polling loops and the check doubles their latency"""
+        if self.use_safe_variants and self._error_check_due():
             return await self.protocol.safe_ask(command, cmd_timeout, abort_on_timeout)
         return await self.protocol.ask(command, cmd_timeout, abort_on_timeout)
 
+    async def ask_cached(self, command: str, ttl: float, cmd_timeout: float = COMMAND_DEFAULT_TIMEOUT) -> str:
+        """Like ask but serves repeat queries from a local cache for up to ttl seconds, use for
+        read-mostly state (identification, ranges, settings) polled in hot loops; call
+        invalidate_cache from anything that changes the underlying state"""
+        cached = self._query_cache.get(command)
+        if cached is not None and time.monotonic() - cached[0] < ttl:
+            return cached[1]
+        response = await self.ask(command, cmd_timeout)
+        self._query_cache[command] = (time.monotonic(), response)
+        return response
+
+    def invalidate_cache(self, command: Optional[str] = None) -> None:
+        """Drop cached query responses and set-command tracking, all of it or just the
+        given command"""
+        if command is None:
+            self._query_cache.clear()
+            self._last_set_values.clear()
+        else:
+            self._query_cache.pop(command, None)
+            self._last_set_values.pop(command, None)
+
+    async def command_if_changed(
+        self, command: str, cmd_timeout: float = COMMAND_DEFAULT_TIMEOUT, abort_on_timeout: bool = True
+    ) -> None:
+        """Send an idempotent set-command only when it differs from the last one sent with the
+        same header (everything before the first space), skipping the round-trip entirely when a
+        control loop re-asserts an already-correct setting. Only use for state nothing else
+        changes behind our back; reset/invalidate_cache drop the tracking"""
+        key = command.partition(" ")[0]
+        if self._last_set_values.get(key) == command:
+            return
+        await self.command(command, cmd_timeout, abort_on_timeout)
+        self._last_set_values[key] = command
+
+    async def command_many(self, commands: Sequence[str], cmd_timeout: float = COMMAND_DEFAULT_TIMEOUT) -> None:
+        """Wrap the protocol command_many (using safe version if requested), turns N commands
+        into a single round-trip on transports that support batching"""
+        if self.use_safe_variants:
+            return await self.protocol.safe_command_many(commands, cmd_timeout)
+        return await self.protocol.command_many(commands, cmd_timeout)
+
+    async def query_many(self, commands: Sequence[str], cmd_timeout: float = COMMAND_DEFAULT_TIMEOUT) -> Sequence[str]:
+        """Wrap the protocol ask_many (using safe version if requested), turns N queries into
+        a single round-trip on transports that support batching"""
+        if self.use_safe_variants:
+            return await self.protocol.safe_ask_many(commands, cmd_timeout)
+        return await self.protocol.ask_many(commands, cmd_timeout)
+
     async def quit(self) -> None:
         """Shuts down any background threads that might be active"""
         await self.protocol.quit()
@@ -315,6 +478,7 @@ class SCPIDevice:  # pylint: disable=R0904
 
     async def reset(self) -> None:
         """Resets the device to known state (with *RST) and clears the error log"""
+        self.invalidate_cache()
         return await self.protocol.command("*RST;*CLS")
 
     async def wait_for_complete(self, wait_timeout: float) -> bool:
@@ -379,6 +543,13 @@ class SCPIDevice:  # pylint: disable=R0904
         however we do not do it transparently here since it triggers all devices on the bus"""
         await self.command("*TRG")
 
+    async def trigger_group(self) -> None:
+        """Send the Group Execute Trigger GPIB message, this triggers in one bus operation
+        instead of one *TRG round-trip per device (see trigger), requires a GPIB transport"""
+        if not isinstance(self.transport, (GPIBTransport, GPIBDeviceTransport)):
+            raise RuntimeError("Group trigger requires a GPIB transport")
+        await self.transport.send_group_trig()
+
     async def clear_status(self) -> None:
         """
         Sends a clear status command.
@@ -3,8 +3,9 @@
 All transports must define certain basic methods (check all the raise NotImplementedError)
 """
 
-from typing import Optional, Callable
+from typing import Optional, Callable, Deque
 import asyncio
+import collections
 import logging
 import threading
 from abc import ABC, abstractmethod
@@ -12,12 +13,17 @@ from dataclasses import dataclass, field
 
 
 LOGGER = logging.getLogger(__name__)
+UNSOLICITED_STACK_SIZE = 64
 
 
 class AbstractTransport(ABC):  # pylint: disable=R0903
     """So that for example GPIBDeviceTransport can be identified as transport without inheriting
     the low-level transport methods"""
 
+    # Whether semicolon-compounded commands can be sent as a single write, protocol layers
+    # may use this to piggyback for example the error query on the command itself
+    batching_supported = True
+
 
 @dataclass
 class BaseTransport(AbstractTransport, ABC):
@@ -26,8 +32,17 @@ class BaseTransport(AbstractTransport, ABC):
     message_callback: Optional[Callable[[str], None]] = field(default=None)
     unsolicited_message_callback: Optional[Callable[[str], None]] = field(default=None)
     lock: asyncio.Lock = field(default_factory=asyncio.Lock)
-    aioevent: asyncio.Event = field(default_factory=asyncio.Event)
+    aioevent: Optional[asyncio.Event] = field(default=None)
     blevent: threading.Event = field(default_factory=threading.Event)
+    unsolicited_messages: Deque[str] = field(default_factory=lambda: collections.deque(maxlen=UNSOLICITED_STACK_SIZE))
+
+    def _get_aioevent(self) -> asyncio.Event:
+        """Create the event lazily so it binds to the running event loop, pre-3.10 asyncio
+        primitives capture their loop at construction time which breaks transports that are
+        instantiated outside the loop they are later used in (e.g. via the sync helpers)"""
+        if self.aioevent is None:
+            self.aioevent = asyncio.Event()
+        return self.aioevent
 
     @abstractmethod
     async def quit(self) -> None:
@@ -56,7 +71,10 @@ class BaseTransport(AbstractTransport, ABC):
         if self.unsolicited_message_callback is not None:
             self.unsolicited_message_callback(message)
             return
-        LOGGER.info("Got unsolicited message but have no callback to send it to")
+        # deque.append is thread-safe and O(1) so this is safe to do from reader threads,
+        # the maxlen bound keeps a chatty device from growing the buffer forever
+        self.unsolicited_messages.append(message)
+        LOGGER.info("Got unsolicited message but have no callback to send it to, buffered it")
 
     @abstractmethod
     async def abort_command(self) -> None:
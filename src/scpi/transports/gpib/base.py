@@ -60,6 +60,11 @@ class GPIBDeviceTransport(AbstractTransport):
         await self._set_ll_address()
         await self.lltransport.send_loc()
 
+    async def send_group_trig(self) -> None:
+        """Send Group Execute Trigger, see low-level transport method docs for more info"""
+        await self._set_ll_address()
+        await self.lltransport.send_group_trig()
+
     async def quit(self) -> None:
         """Nop for devices"""
         LOGGER.debug("quit should not be called on device level but we must have the method for type compatibility")
@@ -3,6 +3,7 @@
 from typing import Optional, Sequence, List, Any, Tuple, cast
 import asyncio
 import logging
+import time
 from dataclasses import dataclass
 
 import serial  # type: ignore
@@ -53,11 +54,13 @@ class PrologixGPIBTransport(GPIBTransport, RS232Transport):
         self._serialhandler.protocol.write_line("++ifc")
 
     async def send_command(self, command: str) -> None:
-        """Wrapper for write_line on the protocol with some sanity checks"""
+        """Wrapper for write_line on the protocol with some sanity checks
+
+        The write can block so it is run in an executor instead of stalling the whole event loop"""
         if not self._serialhandler or not self._serialhandler.is_alive():
             raise RuntimeError("Serial handler not ready")
         async with self.lock:
-            self._serialhandler.protocol.write_line(command)
+            await asyncio.get_event_loop().run_in_executor(None, self._serialhandler.protocol.write_line, command)
 
     async def get_response(self) -> str:
         """Get device response"""
@@ -77,18 +80,20 @@ class PrologixGPIBTransport(GPIBTransport, RS232Transport):
 
             async with self.lock:
                 response: Optional[str] = None
+                loop = asyncio.get_event_loop()
+                aioevent = self._get_aioevent()
 
                 # pylint: disable=R0801
                 def set_response(message: str) -> None:
-                    """Callback for setting the response"""
-                    nonlocal response, self
+                    """Callback for setting the response (called from the reader thread)"""
+                    nonlocal response
                     response = message
-                    self.blevent.set()
+                    loop.call_soon_threadsafe(aioevent.set)
 
-                self.blevent.clear()
+                aioevent.clear()
                 self.message_callback = set_response
                 self._serialhandler.protocol.write_line(send)
-                await asyncio.get_event_loop().run_in_executor(None, self.blevent.wait)
+                await aioevent.wait()
                 self.message_callback = None
                 return cast(str, response)
 
@@ -101,11 +106,16 @@ class PrologixGPIBTransport(GPIBTransport, RS232Transport):
         else:
             await self.send_command(f"++addr {primary:d} {secondary:d}")
 
+        # monotonic is immune to wall-clock jumps and computing the deadline once keeps
+        # the confirmation loop cheap (and bounded, it used to be able to spin forever)
+        deadline = time.monotonic() + READ_TIMEOUT
         while True:
             await asyncio.sleep(0.001)
             resp = await self.query_address()
             if resp == (primary, secondary):
                 break
+            if time.monotonic() > deadline:
+                raise asyncio.TimeoutError(f"Controller did not confirm address {primary!r} {secondary!r}")
 
     async def query_address(self) -> AddressTuple:
         """Query the address we are talking to, returns tuple with primary and secondary parts
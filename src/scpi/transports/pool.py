@@ -0,0 +1,35 @@
+"""Simple registry for sharing transports between devices
+
+Opening a serial port spawns a reader thread (and for Prologix re-initializes the controller),
+so scripts that construct several logical devices on the same physical link should reuse one
+transport instead of opening the port again for each device"""
+
+from typing import Any, Dict, cast
+
+from .baseclass import BaseTransport
+from .rs232 import RS232Transport
+from .rs232 import get as _get_rs232
+from .gpib.prologix import PrologixGPIBTransport
+from .gpib.prologix import get as _get_prologix
+
+_TRANSPORTS: Dict[str, BaseTransport] = {}
+
+
+def get_rs232_transport(serial_url: str, **serial_kwargs: Any) -> RS232Transport:
+    """Get an RS232 transport for the given serial url, reusing a previously opened one if found"""
+    if serial_url not in _TRANSPORTS:
+        _TRANSPORTS[serial_url] = _get_rs232(serial_url, **serial_kwargs)
+    return cast(RS232Transport, _TRANSPORTS[serial_url])
+
+
+def get_prologix_transport(serial_url: str, **serial_kwargs: Any) -> PrologixGPIBTransport:
+    """Get a Prologix GPIB transport for the given serial url, reusing a previously opened one
+    if found; use get_device_transport on the result for per-device addressing"""
+    if serial_url not in _TRANSPORTS:
+        _TRANSPORTS[serial_url] = _get_prologix(serial_url, **serial_kwargs)
+    return cast(PrologixGPIBTransport, _TRANSPORTS[serial_url])
+
+
+def forget(serial_url: str) -> None:
+    """Drop a transport from the registry, call this after quitting the transport"""
+    _TRANSPORTS.pop(serial_url, None)
@@ -4,6 +4,7 @@ from __future__ import annotations
 from typing import Optional, Any, Dict, cast
 import asyncio
 import logging
+import os
 from dataclasses import field, dataclass
 
 import serial  # type: ignore
@@ -15,6 +16,27 @@ LOGGER = logging.getLogger(__name__)
 WRITE_TIMEOUT = 1.0
 
 
+def try_lower_latency(port: serial.SerialBase) -> None:
+    """Try to put the serial adapter into low-latency mode, the 16 ms default latency_timer
+    of FTDI-style USB-serial adapters dominates every query round-trip.
+
+    Fails silently on platforms/adapters where this does not apply"""
+    try:
+        port.set_low_latency_mode(True)
+        return
+    except (AttributeError, NotImplementedError, ValueError):
+        pass
+    # Fall back to the sysfs knob on Linux for adapters where the ioctl is not supported
+    devname = os.path.basename(getattr(port, "name", None) or "")
+    if not devname:
+        return
+    try:
+        with open(f"/sys/bus/usb-serial/devices/{devname}/latency_timer", "w", encoding="ascii") as sysfsfile:
+            sysfsfile.write("1\n")
+    except OSError:
+        LOGGER.debug("Could not lower latency_timer for %s", devname)
+
+
 class RS232SerialProtocol(serial.threaded.LineReader):  # type: ignore
     """PySerial "protocol" class for handling stuff"""
 
@@ -41,16 +63,20 @@ class RS232Transport(BaseTransport):
         """Initialize the transport"""
         if not self.serialdevice:
             raise ValueError("serialdevice must be given")
+        try_lower_latency(self.serialdevice)
         self._serialhandler = serial.threaded.ReaderThread(self.serialdevice, RS232SerialProtocol)
         self._serialhandler.start()
         self._serialhandler.protocol.handle_line = self.message_received
 
     async def send_command(self, command: str) -> None:
-        """Wrapper for write_line on the protocol with some sanity checks"""
+        """Wrapper for write_line on the protocol with some sanity checks
+
+        The write can block (especially with hardware flow control) so it is run in an
+        executor instead of stalling the whole event loop"""
         if not self._serialhandler or not self._serialhandler.is_alive():
             raise RuntimeError("Serial handler not ready")
         async with self.lock:
-            self._serialhandler.protocol.write_line(command)
+            await asyncio.get_event_loop().run_in_executor(None, self._serialhandler.protocol.write_line, command)
 
     async def get_response(self) -> str:
         """Serial devices send responses without needing to be told to, just reads it"""
@@ -58,17 +84,19 @@ class RS232Transport(BaseTransport):
         # messages to a stack and return popleft ??
         async with self.lock:
             response: Optional[str] = None
+            loop = asyncio.get_event_loop()
+            aioevent = self._get_aioevent()
 
             # pylint: disable=R0801
             def set_response(message: str) -> None:
-                """Callback for setting the response"""
-                nonlocal response, self
+                """Callback for setting the response (called from the reader thread)"""
+                nonlocal response
                 response = message
-                self.blevent.set()
+                loop.call_soon_threadsafe(aioevent.set)
 
-            self.blevent.clear()
+            aioevent.clear()
             self.message_callback = set_response
-            await asyncio.get_event_loop().run_in_executor(None, self.blevent.wait)
+            await aioevent.wait()
             self.message_callback = None
             return cast(str, response)
 
@@ -2,6 +2,8 @@
 
 from typing import Optional
 import asyncio
+import functools
+import socket
 from dataclasses import dataclass, field
 import logging
 
@@ -10,6 +12,14 @@ from .baseclass import BaseTransport
 
 
 LOGGER = logging.getLogger(__name__)
+TERMINATOR = b"\r\n"
+
+
+@functools.lru_cache(maxsize=256)
+def _encode_command(command: str) -> bytes:
+    """Encode command with terminator, cached so commands repeated in polling loops
+    do not pay for the encode + concatenation every time"""
+    return command.encode() + TERMINATOR
 
 
 @dataclass
@@ -18,12 +28,18 @@ class TCPTransport(BaseTransport):
 
     ipaddr: Optional[str] = field(default=None)
     port: Optional[int] = field(default=None)
+    nodelay: bool = field(default=True)
     reader: Optional[asyncio.StreamReader] = field(default=None)
     writer: Optional[asyncio.StreamWriter] = field(default=None)
 
     async def open_connection(self, ipaddr: str, port: int) -> None:
         """Open a connection (also update the IP/port)"""
         self.reader, self.writer = await asyncio.open_connection(ipaddr, port)
+        if self.nodelay:
+            sock = self.writer.get_extra_info("socket")
+            if sock is not None:
+                # Disable Nagle's algorithm, SCPI commands are tiny and latency-bound
+                sock.setsockopt(socket.IPPROTO_TCP, socket.TCP_NODELAY, 1)
         self.ipaddr = ipaddr
         self.port = port
 
@@ -41,9 +57,8 @@ class TCPTransport(BaseTransport):
         if not self.writer:
             raise RuntimeError("Writer not set")
         async with self.lock:
-            LOGGER.debug("sending command: {}".format(command))
-            self.writer.write((command + "\r\n").encode())
-            await asyncio.sleep(0.05)
+            LOGGER.debug("sending command: %s", command)
+            self.writer.write(_encode_command(command))
             await self.writer.drain()
 
     async def get_response(self) -> str:
@@ -57,7 +72,7 @@ class TCPTransport(BaseTransport):
         async with self.lock:
             data = await self.reader.readline()
             res = data.decode()
-            LOGGER.debug("Got response: {}".format(res.strip()))
+            LOGGER.debug("Got response: %s", res.strip())
             return res
 
     async def quit(self) -> None:
@@ -24,7 +24,7 @@ class AIOWrapper:  # pylint: disable=R0903
                 try:
                     setattr(self.__class__, attr, getattr(self._device.__class__, attr))
                 except AttributeError:
-                    LOGGER.debug("Could not copy {}".format(attr))
+                    LOGGER.debug("Could not copy %s", attr)
 
     def __getattr__(self, item: str) -> Any:
         """Get a memeber, if it's a coroutine autowrap it to eventloop run"""